@@ -8,6 +8,21 @@ DEBUG = getenv('DEBUG', 'False').lower() in ('true', '1', 'yes', 'on')
 SERVER_NAME = getenv('MCP_SERVER_NAME', 'openapi-mcp')
 URI_SCHEME = getenv('MCP_URI_SCHEME', 'openapi')
 
+# SSE session limits
+# Maximum number of concurrent SSE sessions before new connections get a 503
+SSE_MAX_SESSIONS = int(getenv('SSE_MAX_SESSIONS', '100'))
+# Seconds without any MCP message in either direction before a session is closed
+SSE_IDLE_TIMEOUT = float(getenv('SSE_IDLE_TIMEOUT', '900'))
+# Maximum number of outbound messages buffered per session
+SSE_SEND_QUEUE_SIZE = int(getenv('SSE_SEND_QUEUE_SIZE', '32'))
+# Seconds to wait for a slow client to accept a message before dropping its session
+SSE_SEND_TIMEOUT = float(getenv('SSE_SEND_TIMEOUT', '30'))
+# Value of the Retry-After header sent with 503 responses when at capacity
+SSE_RETRY_AFTER = int(getenv('SSE_RETRY_AFTER', '30'))
+
+# Maximum number of bytes returned by a single ranged resource read
+RESOURCE_CHUNK_SIZE = int(getenv('RESOURCE_CHUNK_SIZE', str(256 * 1024)))
+
 # Cache directory for OpenAPI specifications
 CACHE_DIR = Path(getenv('CACHE_DIR', f'{Path.home()}/.cache/openapi-specs'))
 
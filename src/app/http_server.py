@@ -4,12 +4,14 @@ import asyncio
 import logging
 import sys
 from collections.abc import Awaitable, Callable, MutableMapping
+from contextlib import AsyncExitStack
 from typing import Any
 
 from mcp.server.sse import SseServerTransport
 
-from app.config import DEBUG, SERVER_NAME
+from app.config import DEBUG, SERVER_NAME, SSE_RETRY_AFTER
 from app.mcp_server import OpenAPIMCPServer
+from app.session_manager import SseSessionManager
 from app.spec_fetcher import SpecFetcher
 
 # Configure logging
@@ -24,7 +26,10 @@ logger = logging.getLogger(__name__)
 # Global instances (initialized on first request)
 _mcp_server: OpenAPIMCPServer | None = None
 _sse_transport: SseServerTransport | None = None
+_session_manager = SseSessionManager()
 _initialization_lock = asyncio.Lock()
+# Serializes SSE connection setup so each connection can tell which transport session it created
+_connect_lock = asyncio.Lock()
 
 
 async def initialize_server() -> tuple[OpenAPIMCPServer, SseServerTransport]:
@@ -52,7 +57,7 @@ async def initialize_server() -> tuple[OpenAPIMCPServer, SseServerTransport]:
         logger.info(f'Successfully fetched {len(specs)} API specifications')
 
         # Initialize MCP server
-        _mcp_server = OpenAPIMCPServer(specs)
+        _mcp_server = OpenAPIMCPServer(specs, spec_fetcher=spec_fetcher)
 
         # Create SSE transport (must be persistent across requests)
         _sse_transport = SseServerTransport('/messages')
@@ -78,21 +83,49 @@ async def handle_sse(
     """
     logger.info('New SSE connection received')
 
+    session = _session_manager.acquire()
+    if session is None:
+        await send(
+            {
+                'type': 'http.response.start',
+                'status': 503,
+                'headers': [
+                    [b'content-type', b'text/plain'],
+                    [b'retry-after', str(SSE_RETRY_AFTER).encode()],
+                ],
+            }
+        )
+        await send(
+            {
+                'type': 'http.response.body',
+                'body': b'Service Unavailable: too many active sessions',
+            }
+        )
+        return
+
+    transport_session_ids: set[Any] = set()
+    sse_transport: SseServerTransport | None = None
     try:
         # Get or initialize the server and transport
         mcp_server, sse_transport = await initialize_server()
         server = mcp_server.get_server()
 
         # Handle the SSE connection
-        async with sse_transport.connect_sse(scope, receive, send) as streams:
-            await server.run(
-                streams[0],
-                streams[1],
-                server.create_initialization_options(),
-            )
+        async with AsyncExitStack() as stack:
+            async with _connect_lock:
+                known_session_ids = set(sse_transport._read_stream_writers)
+                streams = await stack.enter_async_context(sse_transport.connect_sse(scope, receive, send))
+                transport_session_ids = set(sse_transport._read_stream_writers) - known_session_ids
+            await session.run(server, streams[0], streams[1])
     except Exception as e:
         logger.error(f'Error handling SSE connection: {e}', exc_info=True)
         raise
+    finally:
+        # Some mcp versions never remove a session from the shared transport once its connection ends
+        if sse_transport is not None:
+            for session_id in transport_session_ids:
+                sse_transport._read_stream_writers.pop(session_id, None)
+        _session_manager.release(session)
 
 
 async def handle_messages(
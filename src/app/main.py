@@ -32,7 +32,7 @@ async def main() -> None:
         logger.info(f'Successfully fetched {len(specs)} API specifications')
 
         # Initialize and start MCP server
-        mcp_server = OpenAPIMCPServer(specs)
+        mcp_server = OpenAPIMCPServer(specs, spec_fetcher=spec_fetcher)
         server = mcp_server.get_server()
 
         logger.info('Starting MCP server with stdio transport...')
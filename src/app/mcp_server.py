@@ -4,14 +4,47 @@ import json
 import logging
 from collections.abc import Sequence
 from typing import Any
+from urllib.parse import parse_qs
 
 from mcp.server import Server
-from mcp.types import Resource
+from mcp.types import Resource, ResourceTemplate, TextContent, Tool
 
-from app.config import API_CONFIGS, SERVER_NAME, URI_SCHEME
+from app.config import API_CONFIGS, RESOURCE_CHUNK_SIZE, SERVER_NAME, URI_SCHEME
+from app.operations import build_operation_id_index, collect_local_refs
+from app.spec_fetcher import SpecFetcher
+from app.spec_index import HTTP_METHODS
 
 logger = logging.getLogger(__name__)
 
+GET_OPERATIONS_TOOL = Tool(
+    name='get_operations',
+    description=(
+        'Look up several API operations in one call. Identify each operation by api_id plus either '
+        'operation_id or path and method. Schemas referenced by the operations are returned once each '
+        'in a shared definitions section, keyed by API ID and $ref.'
+    ),
+    inputSchema={
+        'type': 'object',
+        'properties': {
+            'operations': {
+                'type': 'array',
+                'minItems': 1,
+                'items': {
+                    'type': 'object',
+                    'properties': {
+                        'api_id': {'type': 'string', 'description': 'API identifier (e.g., benefits-claims-v2)'},
+                        'operation_id': {'type': 'string', 'description': 'operationId of the operation'},
+                        'path': {'type': 'string', 'description': 'Path of the operation (e.g., /claims/{id})'},
+                        'method': {'type': 'string', 'description': 'HTTP method of the operation (e.g., get)'},
+                    },
+                    'required': ['api_id'],
+                },
+            },
+        },
+        'required': ['operations'],
+    },
+)
+
 
 class OpenAPIMCPServer:
     """MCP server that exposes OpenAPI specifications as resources."""
@@ -21,6 +54,8 @@ class OpenAPIMCPServer:
         specs: dict[str, dict[str, Any]],
         server_name: str = SERVER_NAME,
         uri_scheme: str = URI_SCHEME,
+        chunk_size: int = RESOURCE_CHUNK_SIZE,
+        spec_fetcher: SpecFetcher | None = None,
     ) -> None:
         """Initialize the MCP server.
 
@@ -28,15 +63,158 @@ class OpenAPIMCPServer:
             specs: Dictionary mapping API IDs to their OpenAPI specifications
             server_name: Name of the MCP server
             uri_scheme: URI scheme to use for resources (e.g., 'openapi', 'va')
+            chunk_size: Maximum number of bytes returned by a single ranged resource read
+            spec_fetcher: Spec fetcher whose cache files resource reads are served from, if any
         """
         self.specs = specs
         self.server_name = server_name
         self.uri_scheme = uri_scheme
+        self.chunk_size = chunk_size
+        self.spec_fetcher = spec_fetcher
         self.server = Server(server_name)
+        self._operation_ids: dict[str, dict[str, tuple[str, str]]] = {}
         self._register_handlers()
 
+    def _read_payload(self, api_id: str, query: str) -> str:
+        """Read a specification, or a byte range of it, as compact JSON.
+
+        When the specification is cached, only the requested range of the cache file
+        is read. Otherwise the specification is serialized for this request only.
+        Both are pure ASCII (non-ASCII characters are escaped), so character offsets
+        are also byte offsets.
+
+        Args:
+            api_id: API identifier
+            query: URI query string with the byte range, or '' for the whole specification
+
+        Returns:
+            The requested part of the specification as a JSON string
+        """
+        if self.spec_fetcher is not None:
+            size = self.spec_fetcher.get_cached_size(api_id)
+            if size is not None:
+                start, end = self._parse_range(query, size) if query else (0, size)
+                chunk = self.spec_fetcher.read_cached_range(api_id, start, end)
+                if chunk is not None:
+                    return chunk
+
+        payload = json.dumps(self.specs[api_id], separators=(',', ':'))
+        if not query:
+            return payload
+
+        start, end = self._parse_range(query, len(payload))
+        return payload[start:end]
+
+    def _parse_range(self, query: str, size: int) -> tuple[int, int]:
+        """Parse the byte range of a ranged resource read.
+
+        Args:
+            query: URI query string (e.g., 'offset=0&length=65536')
+            size: Total size of the payload in bytes
+
+        Returns:
+            Tuple of (start, end) byte offsets, with end - start at most `chunk_size`
+
+        Raises:
+            ValueError: If the offset or length is not a valid non-negative integer or is out of range
+        """
+        params = parse_qs(query)
+        try:
+            offset = int(params.get('offset', ['0'])[0])
+            length = int(params.get('length', [str(self.chunk_size)])[0])
+        except ValueError as e:
+            raise ValueError(f'Invalid range: {query}') from e
+
+        if offset < 0 or length < 0 or offset > size:
+            raise ValueError(f'Invalid range: {query}. Payload size is {size} bytes')
+
+        return offset, min(offset + min(length, self.chunk_size), size)
+
+    def _find_operation(self, request: Any) -> tuple[str, str, str]:
+        """Find the operation identified by a batch lookup request.
+
+        Args:
+            request: Dictionary with 'api_id' and either 'operation_id' or 'path' and 'method'
+
+        Returns:
+            Tuple of (api_id, path, method)
+
+        Raises:
+            ValueError: If the request is malformed or incomplete, or the API or operation does not exist
+        """
+        if not isinstance(request, dict):
+            raise ValueError('Each operation must be an object')
+
+        api_id = request.get('api_id')
+        if not isinstance(api_id, str):
+            raise ValueError('api_id must be a string')
+        if api_id not in self.specs:
+            raise ValueError(f'Unknown API: {api_id}')
+
+        for field in ('operation_id', 'path', 'method'):
+            if request.get(field) is not None and not isinstance(request[field], str):
+                raise ValueError(f'{field} must be a string')
+
+        spec = self.specs[api_id]
+        operation_id = request.get('operation_id')
+        if operation_id is not None:
+            if api_id not in self._operation_ids:
+                self._operation_ids[api_id] = build_operation_id_index(spec)
+            if operation_id not in self._operation_ids[api_id]:
+                raise ValueError(f'Unknown operation for {api_id}: {operation_id}')
+            return api_id, *self._operation_ids[api_id][operation_id]
+
+        path = request.get('path')
+        method = str(request.get('method', '')).lower()
+        if path is None or not method:
+            raise ValueError('Either operation_id or path and method is required')
+        path_item = spec.get('paths', {}).get(path)
+        if method not in HTTP_METHODS or not isinstance(path_item, dict) or not isinstance(path_item.get(method), dict):
+            raise ValueError(f'Unknown operation for {api_id}: {method.upper()} {path}')
+        return api_id, path, method
+
+    def get_operations(self, requests: list[Any]) -> dict[str, Any]:
+        """Look up several operations, sharing the schemas they reference.
+
+        Lookups that fail are reported per item rather than failing the whole batch.
+
+        Args:
+            requests: List of dictionaries with 'api_id' and either 'operation_id' or 'path' and 'method'
+
+        Returns:
+            Dictionary with 'operations' (one entry per request, in order) and 'definitions'
+            (referenced definitions keyed by API ID and then by '$ref', each included once)
+        """
+        operations: list[dict[str, Any]] = []
+        definitions: dict[str, dict[str, Any]] = {}
+
+        for request in requests:
+            try:
+                api_id, path, method = self._find_operation(request)
+            except ValueError as e:
+                item = request if isinstance(request, dict) else {'request': request}
+                operations.append({**item, 'error': str(e)})
+                continue
+
+            path_item = self.specs[api_id]['paths'][path]
+            operation = path_item[method]
+            entry: dict[str, Any] = {
+                'api_id': api_id,
+                'path': path,
+                'method': method,
+                'operation_id': operation.get('operationId'),
+                'operation': operation,
+            }
+            if 'parameters' in path_item:
+                entry['path_parameters'] = path_item['parameters']
+            operations.append(entry)
+
+            collect_local_refs(self.specs[api_id], entry, definitions.setdefault(api_id, {}))
+
+        return {'operations': operations, 'definitions': definitions}
+
     def _register_handlers(self) -> None:
-        """Register MCP server handlers for resources."""
+        """Register MCP server handlers for resources and tools."""
 
         @self.server.list_resources()  # type: ignore[no-untyped-call, misc]
         async def list_resources() -> Sequence[Resource]:
@@ -50,22 +228,39 @@ class OpenAPIMCPServer:
                             name=f'{api_config["name"]} - OpenAPI Specification',
                             mimeType='application/json',
                             description=api_config['description'],
+                            size=self.spec_fetcher.get_cached_size(api_id) if self.spec_fetcher else None,
                         )
                     )
             return resources
 
+        @self.server.list_resource_templates()  # type: ignore[no-untyped-call, misc]
+        async def list_resource_templates() -> Sequence[ResourceTemplate]:
+            """List the template for reading OpenAPI specifications in chunks."""
+            return [
+                ResourceTemplate(
+                    uriTemplate=f'{self.uri_scheme}://api/{{api_id}}/openapi{{?offset,length}}',
+                    name='OpenAPI Specification (byte range)',
+                    mimeType='application/json',
+                    description=(
+                        f'Read part of an OpenAPI specification. Returns at most {self.chunk_size} bytes '
+                        'starting at offset; the total size is reported by the resource listing when the spec is cached.'
+                    ),
+                )
+            ]
+
         @self.server.read_resource()  # type: ignore[no-untyped-call, misc]
         async def read_resource(uri: str) -> str:
             """Read a specific OpenAPI specification resource.
 
             Args:
-                uri: Resource URI in format '{scheme}://api/{api_id}/openapi'
+                uri: Resource URI in format '{scheme}://api/{api_id}/openapi', optionally
+                    followed by '?offset={offset}&length={length}' to read a byte range
 
             Returns:
-                The OpenAPI specification as a JSON string
+                The OpenAPI specification (or the requested byte range of it) as a JSON string
             """
             # Convert URI to string (in case it's an AnyUrl object from Pydantic)
-            uri_str = str(uri)
+            uri_str, _, query = str(uri).partition('?')
 
             # Parse URI to extract API ID
             expected_prefix = f'{self.uri_scheme}://api/'
@@ -82,8 +277,34 @@ class OpenAPIMCPServer:
             if api_id not in self.specs:
                 raise ValueError(f'Unknown API: {api_id}')
 
-            spec = self.specs[api_id]
-            return json.dumps(spec, indent=2)
+            return self._read_payload(api_id, query)
+
+        @self.server.list_tools()  # type: ignore[no-untyped-call, misc]
+        async def list_tools() -> Sequence[Tool]:
+            """List the available tools."""
+            return [GET_OPERATIONS_TOOL]
+
+        # Items are validated one by one in get_operations so a malformed item does not fail the batch
+        @self.server.call_tool(validate_input=False)  # type: ignore[misc]
+        async def call_tool(name: str, arguments: dict[str, Any]) -> Sequence[TextContent]:
+            """Call a tool.
+
+            Args:
+                name: Tool name
+                arguments: Tool arguments
+
+            Returns:
+                The tool result as JSON text content
+            """
+            if name != GET_OPERATIONS_TOOL.name:
+                raise ValueError(f'Unknown tool: {name}')
+
+            requests = arguments.get('operations')
+            if not isinstance(requests, list) or not requests:
+                raise ValueError('operations must be a non-empty list')
+
+            result = self.get_operations(requests)
+            return [TextContent(type='text', text=json.dumps(result, indent=2))]
 
     def get_server(self) -> Server:
         """Get the MCP server instance.
@@ -0,0 +1,88 @@
+"""Module for looking up operations in OpenAPI specifications and collecting the schemas they reference."""
+
+from collections.abc import Iterator
+from typing import Any
+from urllib.parse import unquote
+
+from app.spec_index import HTTP_METHODS
+
+
+def build_operation_id_index(spec: dict[str, Any]) -> dict[str, tuple[str, str]]:
+    """Map each operationId in a specification to its path and method.
+
+    Args:
+        spec: The OpenAPI specification
+
+    Returns:
+        Dictionary mapping operationId to (path, method)
+    """
+    index: dict[str, tuple[str, str]] = {}
+    for path, path_item in spec.get('paths', {}).items():
+        if not isinstance(path_item, dict):
+            continue
+        for method, operation in path_item.items():
+            if method in HTTP_METHODS and isinstance(operation, dict) and 'operationId' in operation:
+                index.setdefault(operation['operationId'], (path, method))
+    return index
+
+
+def resolve_local_ref(spec: dict[str, Any], ref: str) -> Any | None:
+    """Resolve a local '$ref' (e.g., '#/components/schemas/Claim') against a specification.
+
+    Args:
+        spec: The OpenAPI specification
+        ref: The reference
+
+    Returns:
+        The referenced value, or None if the reference is not local or does not resolve
+    """
+    if not ref.startswith('#/'):
+        return None
+
+    value: Any = spec
+    for raw_token in ref[2:].split('/'):
+        # Percent-decode each token separately so an encoded '/' stays inside its key
+        token = unquote(raw_token).replace('~1', '/').replace('~0', '~')
+        if isinstance(value, dict) and token in value:
+            value = value[token]
+        elif isinstance(value, list) and token.isdigit() and int(token) < len(value):
+            value = value[int(token)]
+        else:
+            return None
+    return value
+
+
+def _iter_refs(value: Any) -> Iterator[str]:
+    """Yield every '$ref' string found in a value."""
+    if isinstance(value, dict):
+        ref = value.get('$ref')
+        if isinstance(ref, str):
+            yield ref
+        for child in value.values():
+            yield from _iter_refs(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _iter_refs(child)
+
+
+def collect_local_refs(spec: dict[str, Any], value: Any, definitions: dict[str, Any]) -> None:
+    """Add every local reference used by a value, transitively, to a definitions mapping.
+
+    References already present in `definitions` are not visited again, so the same
+    mapping can be shared across several values to include each definition once.
+
+    Args:
+        spec: The OpenAPI specification the references point into
+        value: The value to scan (e.g., an operation)
+        definitions: Mapping of reference to resolved definition, updated in place
+    """
+    pending = list(_iter_refs(value))
+    while pending:
+        ref = pending.pop()
+        if ref in definitions:
+            continue
+        target = resolve_local_ref(spec, ref)
+        if target is None:
+            continue
+        definitions[ref] = target
+        pending.extend(_iter_refs(target))
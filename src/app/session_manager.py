@@ -0,0 +1,213 @@
+"""SSE session lifecycle management: concurrency limits, idle reaping and outbound backpressure."""
+
+import logging
+import time
+from itertools import count
+from typing import Any, Protocol
+
+import anyio
+from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+
+from app.config import SSE_IDLE_TIMEOUT, SSE_MAX_SESSIONS, SSE_SEND_QUEUE_SIZE, SSE_SEND_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+
+class SessionServer(Protocol):
+    """The part of `mcp.server.Server` that a session needs to run it."""
+
+    def create_initialization_options(self) -> Any: ...
+
+    async def run(
+        self,
+        read_stream: MemoryObjectReceiveStream[Any],
+        write_stream: MemoryObjectSendStream[Any],
+        initialization_options: Any,
+        /,
+    ) -> None: ...
+
+
+class SseSession:
+    """A single SSE client session with activity tracking and a bounded outbound queue."""
+
+    def __init__(self, session_id: int, idle_timeout: float, send_queue_size: int, send_timeout: float) -> None:
+        """Initialize the session.
+
+        Args:
+            session_id: Identifier used in logs and stats
+            idle_timeout: Seconds without inbound or outbound messages before the session is reaped
+            send_queue_size: Maximum number of outbound messages buffered for the client
+            send_timeout: Seconds to wait for the client to accept a message before dropping the session
+        """
+        self.session_id = session_id
+        self.idle_timeout = idle_timeout
+        self.send_queue_size = send_queue_size
+        self.send_timeout = send_timeout
+        self.started_at = time.monotonic()
+        self.last_activity = self.started_at
+        self.messages_received = 0
+        self.messages_sent = 0
+        self.close_reason: str | None = None
+        self._outbound: MemoryObjectSendStream[Any] | None = None
+        self._cancel_scope: anyio.CancelScope | None = None
+
+    def touch(self) -> None:
+        """Record activity on the session."""
+        self.last_activity = time.monotonic()
+
+    def queued_messages(self) -> int:
+        """Get the number of outbound messages waiting to be sent to the client."""
+        if self._outbound is None:
+            return 0
+        return self._outbound.statistics().current_buffer_used
+
+    def stats(self) -> dict[str, Any]:
+        """Get a snapshot of the session's resource usage.
+
+        Returns:
+            Dictionary with session age, idle time, message counts and outbound queue depth
+        """
+        now = time.monotonic()
+        return {
+            'session_id': self.session_id,
+            'age_seconds': round(now - self.started_at, 3),
+            'idle_seconds': round(now - self.last_activity, 3),
+            'messages_received': self.messages_received,
+            'messages_sent': self.messages_sent,
+            'queued_messages': self.queued_messages(),
+        }
+
+    def close(self, reason: str) -> None:
+        """Cancel the session.
+
+        Args:
+            reason: Why the session is being closed (e.g., 'idle', 'slow consumer')
+        """
+        if self.close_reason is None:
+            self.close_reason = reason
+        if self._cancel_scope is not None:
+            self._cancel_scope.cancel()
+
+    async def run(
+        self,
+        server: SessionServer,
+        read_stream: MemoryObjectReceiveStream[Any],
+        write_stream: MemoryObjectSendStream[Any],
+    ) -> None:
+        """Run the MCP server over the transport streams until the client disconnects or the session is closed.
+
+        Outbound messages go through a bounded buffer. When it is full the server blocks
+        (backpressure); when the client does not accept a message within `send_timeout`
+        the session is dropped.
+
+        Args:
+            server: The MCP server to run
+            read_stream: Transport stream of messages from the client
+            write_stream: Transport stream of messages to the client
+        """
+        inbound_send, inbound_recv = anyio.create_memory_object_stream[Any](0)
+        outbound_send, outbound_recv = anyio.create_memory_object_stream[Any](self.send_queue_size)
+        self._outbound = outbound_send
+
+        async def forward_inbound() -> None:
+            async with inbound_send:
+                async for message in read_stream:
+                    self.touch()
+                    self.messages_received += 1
+                    await inbound_send.send(message)
+
+        async def forward_outbound() -> None:
+            async with outbound_recv:
+                async for message in outbound_recv:
+                    try:
+                        with anyio.fail_after(self.send_timeout):
+                            await write_stream.send(message)
+                    except TimeoutError:
+                        self.close('slow consumer')
+                        return
+                    except (anyio.BrokenResourceError, anyio.ClosedResourceError):
+                        # The transport closes its side of the stream when the client disconnects
+                        self.close('client disconnected')
+                        return
+                    self.touch()
+                    self.messages_sent += 1
+
+        async def reap_when_idle() -> None:
+            while True:
+                remaining = self.last_activity + self.idle_timeout - time.monotonic()
+                if remaining <= 0:
+                    self.close('idle')
+                    return
+                await anyio.sleep(remaining)
+
+        try:
+            async with anyio.create_task_group() as tg:
+                self._cancel_scope = tg.cancel_scope
+                tg.start_soon(forward_inbound)
+                tg.start_soon(forward_outbound)
+                tg.start_soon(reap_when_idle)
+                async with inbound_recv, outbound_send:
+                    await server.run(inbound_recv, outbound_send, server.create_initialization_options())
+                tg.cancel_scope.cancel()
+        finally:
+            # Closing the transport's write stream ends the SSE response
+            write_stream.close()
+
+
+class SseSessionManager:
+    """Tracks active SSE sessions and enforces the concurrent session limit."""
+
+    def __init__(
+        self,
+        max_sessions: int = SSE_MAX_SESSIONS,
+        idle_timeout: float = SSE_IDLE_TIMEOUT,
+        send_queue_size: int = SSE_SEND_QUEUE_SIZE,
+        send_timeout: float = SSE_SEND_TIMEOUT,
+    ) -> None:
+        """Initialize the session manager.
+
+        Args:
+            max_sessions: Maximum number of concurrent SSE sessions
+            idle_timeout: Seconds without messages before a session is reaped
+            send_queue_size: Maximum number of outbound messages buffered per session
+            send_timeout: Seconds to wait on a slow client before dropping its session
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.send_queue_size = send_queue_size
+        self.send_timeout = send_timeout
+        self.sessions: dict[int, SseSession] = {}
+        self._ids = count(1)
+
+    def acquire(self) -> SseSession | None:
+        """Register a new session if there is capacity.
+
+        Returns:
+            The new session, or None if the concurrent session limit has been reached
+        """
+        if len(self.sessions) >= self.max_sessions:
+            logger.warning(f'Rejecting SSE connection: {len(self.sessions)}/{self.max_sessions} sessions active')
+            return None
+
+        session = SseSession(next(self._ids), self.idle_timeout, self.send_queue_size, self.send_timeout)
+        self.sessions[session.session_id] = session
+        logger.info(f'Opened SSE session {session.session_id} ({len(self.sessions)}/{self.max_sessions} active)')
+        return session
+
+    def release(self, session: SseSession) -> None:
+        """Unregister a session once its connection has ended.
+
+        Args:
+            session: The session to release
+        """
+        self.sessions.pop(session.session_id, None)
+        reason = session.close_reason or 'client disconnected'
+        logger.info(f'Closed SSE session {session.session_id} ({reason}): {session.stats()}')
+
+    def stats(self) -> list[dict[str, Any]]:
+        """Get resource usage for all active sessions.
+
+        Returns:
+            List of per-session stats
+        """
+        return [session.stats() for session in self.sessions.values()]
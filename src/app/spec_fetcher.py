@@ -2,15 +2,66 @@
 
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
 import httpx
+import yaml
 
 from app.config import API_CONFIGS, CACHE_DIR
+from app.spec_index import INDEX_VERSION, build_spec_index
 
 logger = logging.getLogger(__name__)
 
+YAML_MEDIA_TYPES = frozenset({'application/yaml', 'application/x-yaml', 'text/yaml', 'text/x-yaml'})
+YAML_EXTENSIONS = ('.yaml', '.yml')
+
+# Use libyaml's C parser when PyYAML was built with it; the pure-Python parser is much slower
+try:
+    from yaml import CSafeLoader as _BaseSpecLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _BaseSpecLoader  # type: ignore[assignment]
+
+
+class _SpecLoader(_BaseSpecLoader):
+    """Safe YAML loader that only resolves true/false as booleans, as YAML 1.2 does.
+
+    PyYAML follows YAML 1.1, where unquoted yes/no/on/off are booleans. In OpenAPI
+    documents these are usually enum values or property names that must stay strings.
+    """
+
+
+_SpecLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag != 'tag:yaml.org,2002:bool']
+    for first, resolvers in _BaseSpecLoader.yaml_implicit_resolvers.items()
+}
+_SpecLoader.add_implicit_resolver(
+    'tag:yaml.org,2002:bool', re.compile(r'^(?:true|True|TRUE|false|False|FALSE)$'), list('tTfF')
+)
+
+
+def detect_spec_format(url: str, content_type: str) -> str:
+    """Detect whether a specification response is JSON or YAML.
+
+    The response content type wins when it is specific; otherwise the URL extension is used.
+
+    Args:
+        url: URL the specification was fetched from
+        content_type: Value of the response Content-Type header
+
+    Returns:
+        'yaml' or 'json'
+    """
+    media_type = content_type.split(';')[0].strip().lower()
+    if media_type in YAML_MEDIA_TYPES:
+        return 'yaml'
+    if media_type == 'application/json' or media_type.endswith('+json'):
+        return 'json'
+
+    path = httpx.URL(url).path.lower()
+    return 'yaml' if path.endswith(YAML_EXTENSIONS) else 'json'
+
 
 class SpecFetcher:
     """Fetches and caches OpenAPI specifications from API endpoints."""
@@ -35,9 +86,94 @@ class SpecFetcher:
         """
         return self.cache_dir / f'{api_id}.json'
 
+    def _get_index_path(self, api_id: str) -> Path:
+        """Get the JSON pointer index file path for a cached API specification.
+
+        Args:
+            api_id: API identifier (e.g., 'benefits-claims-v2')
+
+        Returns:
+            Path to the sidecar index file
+        """
+        return self.cache_dir / f'{api_id}.index.json'
+
+    def _get_metadata_path(self, api_id: str) -> Path:
+        """Get the metadata file path for a cached API specification.
+
+        Args:
+            api_id: API identifier (e.g., 'benefits-claims-v2')
+
+        Returns:
+            Path to the sidecar metadata file
+        """
+        return self.cache_dir / f'{api_id}.meta.json'
+
+    def _write_cache(self, api_id: str, spec: dict[str, Any]) -> Path:
+        """Write a specification to the cache along with its JSON pointer index.
+
+        The specification is written as compact JSON so that the index can address
+        path items, operations and components by byte range.
+
+        Args:
+            api_id: API identifier
+            spec: The OpenAPI specification
+
+        Returns:
+            Path to the cached specification file
+        """
+        text, index = build_spec_index(spec)
+
+        cache_path = self._get_cache_path(api_id)
+        with open(cache_path, 'w', encoding='ascii') as f:
+            f.write(text)
+        # Ties the index to this exact write, so a same-size rewrite of the cache invalidates it
+        index['mtime_ns'] = cache_path.stat().st_mtime_ns
+        with open(self._get_index_path(api_id), 'w') as f:
+            json.dump(index, f)
+
+        return cache_path
+
+    def _write_metadata(self, api_id: str, url: str, source_format: str) -> None:
+        """Record where a cached specification came from.
+
+        Args:
+            api_id: API identifier
+            url: URL the specification was fetched from
+            source_format: Format of the fetched document ('json' or 'yaml')
+        """
+        with open(self._get_metadata_path(api_id), 'w') as f:
+            json.dump({'url': url, 'source_format': source_format}, f)
+
+    def _parse_yaml_spec(self, text: str) -> dict[str, Any]:
+        """Parse a YAML specification and normalize it to plain JSON types.
+
+        YAML allows non-string keys (e.g., response codes like 200) and values such
+        as dates that JSON does not, so the result is round-tripped through JSON.
+        Only true/false are read as booleans. Other YAML 1.1 implicit types still
+        apply, e.g. unquoted dates become strings and 0755-style numbers become octal.
+
+        Args:
+            text: The YAML document
+
+        Returns:
+            The OpenAPI specification as a dictionary
+
+        Raises:
+            ValueError: If the document is not a YAML mapping
+        """
+        data = yaml.load(text, Loader=_SpecLoader)  # nosec B506 - _SpecLoader is a SafeLoader
+        if not isinstance(data, dict):
+            raise ValueError('OpenAPI specification must be a YAML mapping')
+
+        spec: dict[str, Any] = json.loads(json.dumps(data, default=str))
+        return spec
+
     async def fetch_spec(self, api_id: str, url: str) -> dict[str, Any]:
         """Fetch an OpenAPI specification from a URL.
 
+        JSON and YAML sources are supported. YAML is parsed once here and cached as
+        JSON, so later loads cost the same regardless of the source format.
+
         Args:
             api_id: API identifier for caching
             url: URL to fetch the OpenAPI specification from
@@ -47,18 +183,22 @@ class SpecFetcher:
 
         Raises:
             httpx.HTTPError: If the request fails
+            ValueError: If a YAML source is not a mapping
         """
         logger.info(f'Fetching OpenAPI spec for {api_id} from {url}')
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.get(url)
             response.raise_for_status()
-            spec: dict[str, Any] = response.json()
+            source_format = detect_spec_format(url, response.headers.get('content-type', ''))
+            if source_format == 'yaml':
+                spec = self._parse_yaml_spec(response.text)
+            else:
+                spec = response.json()
 
         # Cache the specification
-        cache_path = self._get_cache_path(api_id)
-        with open(cache_path, 'w') as f:
-            json.dump(spec, f, indent=2)
+        cache_path = self._write_cache(api_id, spec)
+        self._write_metadata(api_id, url, source_format)
 
         logger.info(f'Cached OpenAPI spec for {api_id} at {cache_path}')
         return spec
@@ -84,6 +224,120 @@ class SpecFetcher:
             logger.error(f'Error loading cached spec for {api_id}: {e}')
             return None
 
+    def load_cached_metadata(self, api_id: str) -> dict[str, Any] | None:
+        """Load the metadata recorded when a specification was cached.
+
+        Args:
+            api_id: API identifier
+
+        Returns:
+            The metadata (source 'url' and 'source_format') or None if not found
+        """
+        metadata_path = self._get_metadata_path(api_id)
+        if not metadata_path.exists():
+            return None
+
+        try:
+            with open(metadata_path) as f:
+                metadata: dict[str, Any] = json.load(f)
+                return metadata
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(f'Error loading cache metadata for {api_id}: {e}')
+            return None
+
+    def _load_index(self, api_id: str) -> dict[str, Any] | None:
+        """Load the JSON pointer index for a cached specification if it matches the cache file.
+
+        Args:
+            api_id: API identifier
+
+        Returns:
+            The index, or None if it is missing, unreadable or stale
+        """
+        cache_path = self._get_cache_path(api_id)
+        index_path = self._get_index_path(api_id)
+        if not cache_path.exists() or not index_path.exists():
+            return None
+
+        try:
+            with open(index_path) as f:
+                index: dict[str, Any] = json.load(f)
+            stat = cache_path.stat()
+            if (
+                index.get('version') != INDEX_VERSION
+                or index.get('size') != stat.st_size
+                or index.get('mtime_ns') != stat.st_mtime_ns
+            ):
+                logger.warning(f'Ignoring stale spec index for {api_id}')
+                return None
+            return index
+        except (json.JSONDecodeError, AttributeError, OSError) as e:
+            logger.error(f'Error loading spec index for {api_id}: {e}')
+            return None
+
+    def get_cached_size(self, api_id: str) -> int | None:
+        """Get the size of a cached specification file.
+
+        Args:
+            api_id: API identifier
+
+        Returns:
+            The size in bytes, or None if the specification is not cached
+        """
+        try:
+            return self._get_cache_path(api_id).stat().st_size
+        except OSError:
+            return None
+
+    def read_cached_range(self, api_id: str, start: int, end: int) -> str | None:
+        """Read a byte range of a cached specification file without parsing it.
+
+        Cache files are ASCII (non-ASCII characters are escaped by the JSON encoder),
+        so any byte range decodes on its own.
+
+        Args:
+            api_id: API identifier
+            start: Offset of the first byte to read
+            end: Offset one past the last byte to read
+
+        Returns:
+            The bytes as a string, or None if the file cannot be read
+        """
+        try:
+            with open(self._get_cache_path(api_id), 'rb') as f:
+                f.seek(start)
+                return f.read(end - start).decode('ascii')
+        except (ValueError, OSError) as e:
+            logger.error(f'Error reading cached spec range {start}-{end} for {api_id}: {e}')
+            return None
+
+    def read_cached_fragment(self, api_id: str, pointer: str) -> str | None:
+        """Read part of a cached specification without parsing the whole file.
+
+        Only the byte range recorded in the sidecar index is read from disk.
+
+        Args:
+            api_id: API identifier
+            pointer: JSON pointer to a path item, operation or component
+                (e.g., '/paths/~1claims/get', see `app.spec_index.build_json_pointer`)
+
+        Returns:
+            The fragment as a JSON string, or None if it is not indexed or the index is missing or stale
+        """
+        index = self._load_index(api_id)
+        if index is None:
+            return None
+
+        try:
+            start, end = index['pointers'][pointer]
+        except KeyError:
+            return None
+        except (TypeError, ValueError) as e:
+            logger.error(f'Error reading cached fragment {pointer} for {api_id}: {e}')
+            return None
+
+        return self.read_cached_range(api_id, start, end)
+
     async def get_spec(self, api_id: str, url: str, use_cache: bool = True) -> dict[str, Any]:
         """Get an OpenAPI specification, using cache if available.
 
@@ -99,6 +353,13 @@ class SpecFetcher:
             cached = self.load_cached_spec(api_id)
             if cached is not None:
                 logger.info(f'Using cached spec for {api_id}')
+                if self._load_index(api_id) is None:
+                    # Caches written before the index existed, or rewritten without it
+                    logger.info(f'Rebuilding spec index for {api_id}')
+                    self._write_cache(api_id, cached)
+                if self.load_cached_metadata(api_id) is None:
+                    # Caches written before YAML support were always fetched as JSON
+                    self._write_metadata(api_id, url, 'json')
                 return cached
 
         return await self.fetch_spec(api_id, url)
@@ -0,0 +1,113 @@
+"""Module for building byte-offset JSON pointer indexes over cached OpenAPI specifications."""
+
+import json
+from typing import Any
+
+INDEX_VERSION = 2
+
+HTTP_METHODS = frozenset({'get', 'put', 'post', 'delete', 'options', 'head', 'patch', 'trace'})
+
+
+def escape_pointer_token(token: str) -> str:
+    """Escape a single JSON pointer reference token (RFC 6901).
+
+    Args:
+        token: Raw object key (e.g., '/claims/{id}')
+
+    Returns:
+        The escaped token (e.g., '~1claims~1{id}')
+    """
+    return token.replace('~', '~0').replace('/', '~1')
+
+
+def build_json_pointer(*tokens: str) -> str:
+    """Build a JSON pointer from raw reference tokens.
+
+    Args:
+        tokens: Unescaped object keys from the document root
+
+    Returns:
+        The JSON pointer (e.g., '/paths/~1claims/get')
+    """
+    return ''.join(f'/{escape_pointer_token(token)}' for token in tokens)
+
+
+def _is_indexed(tokens: list[str]) -> bool:
+    """Check whether a location should get its own entry in the index.
+
+    Path items, operations, OpenAPI 3 components and Swagger 2 definitions are indexed.
+    """
+    match tokens:
+        case ['paths', _]:
+            return True
+        case ['paths', _, method]:
+            return method in HTTP_METHODS
+        case ['components', _, _]:
+            return True
+        case ['definitions', _]:
+            return True
+    return False
+
+
+def _has_indexed_descendants(tokens: list[str]) -> bool:
+    """Check whether any location below this one can be indexed."""
+    match tokens:
+        case [] | ['paths'] | ['paths', _] | ['components'] | ['components', _] | ['definitions']:
+            return True
+    return False
+
+
+class _IndexingWriter:
+    """Serializes a specification to compact JSON while recording the offsets of indexed locations."""
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._offset = 0
+        self.pointers: dict[str, list[int]] = {}
+
+    def _write(self, text: str) -> None:
+        self._parts.append(text)
+        self._offset += len(text)
+
+    def dump(self, value: Any, tokens: list[str]) -> None:
+        start = self._offset
+        if isinstance(value, dict) and _has_indexed_descendants(tokens):
+            self._write('{')
+            for i, (key, child) in enumerate(value.items()):
+                if i:
+                    self._write(',')
+                self._write(json.dumps(str(key)))
+                self._write(':')
+                self.dump(child, [*tokens, str(key)])
+            self._write('}')
+        else:
+            self._write(json.dumps(value, separators=(',', ':')))
+
+        if _is_indexed(tokens):
+            self.pointers[build_json_pointer(*tokens)] = [start, self._offset]
+
+    def getvalue(self) -> str:
+        return ''.join(self._parts)
+
+
+def build_spec_index(spec: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Serialize a specification to compact JSON and build its JSON pointer index.
+
+    The output is pure ASCII (non-ASCII characters are escaped), so character
+    offsets in the returned text are also byte offsets in the written file.
+
+    Args:
+        spec: The OpenAPI specification
+
+    Returns:
+        Tuple of (compact JSON text, index mapping JSON pointers to [start, end) byte ranges)
+    """
+    writer = _IndexingWriter()
+    writer.dump(spec, [])
+    text = writer.getvalue()
+    index = {
+        'version': INDEX_VERSION,
+        'size': len(text),
+        'pointers': writer.pointers,
+    }
+    return text, index
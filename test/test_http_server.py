@@ -0,0 +1,69 @@
+"""Tests for the http_server module."""
+
+from collections.abc import MutableMapping
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import anyio
+import pytest
+from mcp.server.sse import SseServerTransport
+
+from app import http_server
+from app.config import SSE_RETRY_AFTER
+from app.session_manager import SseSessionManager
+
+
+@pytest.mark.asyncio
+async def test_sse_rejected_at_capacity() -> None:
+    """Test that SSE connections get a 503 with Retry-After once the session limit is reached."""
+    sent: list[MutableMapping[str, Any]] = []
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        sent.append(message)
+
+    scope = {'type': 'http', 'path': '/sse', 'method': 'GET'}
+    with (
+        patch.object(http_server, '_session_manager', SseSessionManager(max_sessions=0)),
+        patch.object(http_server, 'initialize_server', AsyncMock()) as initialize_server,
+    ):
+        await http_server.asgi_app(scope, AsyncMock(), send)
+
+    initialize_server.assert_not_called()
+    assert sent[0]['status'] == 503
+    assert [b'retry-after', str(SSE_RETRY_AFTER).encode()] in sent[0]['headers']
+
+
+class IdleServer:
+    """Minimal stand-in for an MCP server that waits for the client to go away."""
+
+    def create_initialization_options(self) -> None:
+        return None
+
+    async def run(self, read_stream: Any, write_stream: Any, options: Any) -> None:
+        async for _ in read_stream:
+            pass
+
+
+@pytest.mark.asyncio
+async def test_sse_sessions_removed_from_transport() -> None:
+    """Test that ended SSE connections do not leave sessions behind in the shared transport."""
+    transport = SseServerTransport('/messages')
+    mcp_server = MagicMock()
+    mcp_server.get_server.return_value = IdleServer()
+
+    async def receive() -> dict[str, Any]:
+        return {'type': 'http.disconnect'}
+
+    async def send(message: MutableMapping[str, Any]) -> None:
+        pass
+
+    scope = {'type': 'http', 'path': '/sse', 'method': 'GET', 'headers': [], 'query_string': b''}
+    with (
+        patch.object(http_server, '_session_manager', SseSessionManager(max_sessions=1)),
+        patch.object(http_server, 'initialize_server', AsyncMock(return_value=(mcp_server, transport))),
+    ):
+        for _ in range(3):
+            with anyio.fail_after(5):
+                await http_server.handle_sse(scope, receive, send)
+
+    assert transport._read_stream_writers == {}
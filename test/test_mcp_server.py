@@ -1,10 +1,15 @@
 """Tests for the mcp_server module."""
 
+import json
+from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+from mcp import types
 
 from app.mcp_server import OpenAPIMCPServer
+from app.spec_fetcher import SpecFetcher
 
 
 @pytest.fixture
@@ -24,12 +29,51 @@ def sample_specs() -> dict[str, dict[str, Any]]:
     }
 
 
+@pytest.fixture
+def operation_specs() -> dict[str, dict[str, Any]]:
+    """Sample OpenAPI specifications with operations sharing a schema."""
+    claim_ref = {'$ref': '#/components/schemas/Claim'}
+    return {
+        'benefits-claims-v2': {
+            'openapi': '3.0.1',
+            'paths': {
+                '/claims/{id}': {
+                    'parameters': [{'name': 'id', 'in': 'path'}],
+                    'get': {'operationId': 'getClaim', 'responses': {'200': {'schema': claim_ref}}},
+                    'put': {'operationId': 'updateClaim', 'requestBody': {'schema': claim_ref}},
+                    'x-internal': {'owner': 'claims-team'},
+                },
+            },
+            'components': {'schemas': {'Claim': {'type': 'object'}, 'Unused': {'type': 'string'}}},
+        },
+    }
+
+
+@pytest.fixture
+def cached_mcp_server(sample_specs: dict[str, dict[str, Any]], tmp_path: Path) -> OpenAPIMCPServer:
+    """Create an OpenAPIMCPServer that serves resource reads from a spec cache."""
+    spec_fetcher = SpecFetcher(cache_dir=tmp_path / 'cache')
+    for api_id, spec in sample_specs.items():
+        spec_fetcher._write_cache(api_id, spec)
+    return OpenAPIMCPServer(sample_specs, chunk_size=10, spec_fetcher=spec_fetcher)
+
+
 @pytest.fixture
 def mcp_server(sample_specs: dict[str, dict[str, Any]]) -> OpenAPIMCPServer:
     """Create an OpenAPIMCPServer instance for testing."""
     return OpenAPIMCPServer(sample_specs)
 
 
+async def read_resource(mcp_server: OpenAPIMCPServer, uri: str) -> str:
+    """Read a resource through the registered MCP request handler."""
+    handler = mcp_server.server.request_handlers[types.ReadResourceRequest]
+    result = await handler(types.ReadResourceRequest(method='resources/read', params=types.ReadResourceRequestParams(uri=uri)))
+    assert isinstance(result.root, types.ReadResourceResult)
+    content = result.root.contents[0]
+    assert isinstance(content, types.TextResourceContents)
+    return content.text
+
+
 class TestOpenAPIMCPServer:
     """Tests for the OpenAPIMCPServer class."""
 
@@ -52,3 +96,202 @@ class TestOpenAPIMCPServer:
         assert len(mcp_server.specs) == 2
         assert 'benefits-claims-v2' in mcp_server.specs
         assert 'benefits-documents-v1' in mcp_server.specs
+
+    @pytest.mark.asyncio
+    async def test_list_resources_reports_size(self, cached_mcp_server: OpenAPIMCPServer) -> None:
+        """Test that listed resources report the size of their cached payload."""
+        handler = cached_mcp_server.server.request_handlers[types.ListResourcesRequest]
+        result = await handler(types.ListResourcesRequest(method='resources/list'))
+        assert isinstance(result.root, types.ListResourcesResult)
+
+        sizes = {str(resource.uri): resource.size for resource in result.root.resources}
+        full = await read_resource(cached_mcp_server, 'openapi://api/benefits-claims-v2/openapi')
+        assert sizes['openapi://api/benefits-claims-v2/openapi'] == len(full)
+
+    @pytest.mark.asyncio
+    async def test_list_resources_without_cache_does_not_serialize(self, mcp_server: OpenAPIMCPServer) -> None:
+        """Test that listing resources without a spec cache leaves the size unset instead of serializing specs."""
+        handler = mcp_server.server.request_handlers[types.ListResourcesRequest]
+        with patch('app.mcp_server.json.dumps', side_effect=AssertionError('serialized')):
+            result = await handler(types.ListResourcesRequest(method='resources/list'))
+        assert isinstance(result.root, types.ListResourcesResult)
+
+        assert all(resource.size is None for resource in result.root.resources)
+
+    @pytest.mark.asyncio
+    async def test_read_resource_full(self, mcp_server: OpenAPIMCPServer, sample_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that reading without a range returns the whole specification."""
+        text = await read_resource(mcp_server, 'openapi://api/benefits-claims-v2/openapi')
+        assert json.loads(text) == sample_specs['benefits-claims-v2']
+
+    @pytest.mark.asyncio
+    async def test_read_resource_in_chunks(self, sample_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that byte range reads are capped at the chunk size and reassemble to the full payload."""
+        mcp_server = OpenAPIMCPServer(sample_specs, chunk_size=10)
+        uri = 'openapi://api/benefits-claims-v2/openapi'
+        full = await read_resource(mcp_server, uri)
+
+        chunks = []
+        offset = 0
+        while offset < len(full):
+            chunk = await read_resource(mcp_server, f'{uri}?offset={offset}&length=1000')
+            assert 0 < len(chunk) <= 10
+            chunks.append(chunk)
+            offset += len(chunk)
+
+        assert ''.join(chunks) == full
+        assert await read_resource(mcp_server, f'{uri}?offset={len(full)}') == ''
+        assert await read_resource(mcp_server, f'{uri}?offset=2&length=3') == full[2:5]
+
+    @pytest.mark.asyncio
+    async def test_read_resource_from_cache(
+        self, cached_mcp_server: OpenAPIMCPServer, sample_specs: dict[str, dict[str, Any]]
+    ) -> None:
+        """Test that full and ranged reads come from the cache file without serializing the spec."""
+        uri = 'openapi://api/benefits-claims-v2/openapi'
+        compact = json.dumps(sample_specs['benefits-claims-v2'], separators=(',', ':'))
+
+        with patch('app.mcp_server.json.dumps', side_effect=AssertionError('serialized')):
+            full = await read_resource(cached_mcp_server, uri)
+            chunk = await read_resource(cached_mcp_server, f'{uri}?offset=5&length=1000')
+            with pytest.raises(ValueError):
+                await read_resource(cached_mcp_server, f'{uri}?offset={len(compact) + 1}')
+
+        assert full == compact
+        assert chunk == compact[5:15]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('query', ['offset=-1', 'offset=abc', 'length=-5', 'offset=100000'])
+    async def test_read_resource_invalid_range(self, mcp_server: OpenAPIMCPServer, query: str) -> None:
+        """Test that invalid byte ranges are rejected."""
+        with pytest.raises(ValueError):
+            await read_resource(mcp_server, f'openapi://api/benefits-claims-v2/openapi?{query}')
+
+    def test_get_operations_shares_definitions(self, operation_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that operations are returned in order and shared schemas are included once."""
+        mcp_server = OpenAPIMCPServer(operation_specs)
+        result = mcp_server.get_operations(
+            [
+                {'api_id': 'benefits-claims-v2', 'operation_id': 'getClaim'},
+                {'api_id': 'benefits-claims-v2', 'path': '/claims/{id}', 'method': 'PUT'},
+            ]
+        )
+
+        assert [(op['operation_id'], op['method']) for op in result['operations']] == [
+            ('getClaim', 'get'),
+            ('updateClaim', 'put'),
+        ]
+        assert result['operations'][0]['path_parameters'] == [{'name': 'id', 'in': 'path'}]
+        assert result['definitions'] == {'benefits-claims-v2': {'#/components/schemas/Claim': {'type': 'object'}}}
+
+    def test_get_operations_reports_errors_per_item(self, operation_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that failed lookups are reported per item without failing the batch."""
+        mcp_server = OpenAPIMCPServer(operation_specs)
+        result = mcp_server.get_operations(
+            [
+                {'api_id': 'unknown-api', 'operation_id': 'getClaim'},
+                {'api_id': 'benefits-claims-v2', 'operation_id': 'missing'},
+                {'api_id': 'benefits-claims-v2', 'path': '/claims/{id}', 'method': 'delete'},
+                {'api_id': 'benefits-claims-v2', 'path': '/claims/{id}', 'method': 'x-internal'},
+                {'api_id': 'benefits-claims-v2', 'path': '/claims/{id}', 'method': 'parameters'},
+                {'api_id': 'benefits-claims-v2'},
+                {'api_id': 'benefits-claims-v2', 'operation_id': 'getClaim'},
+            ]
+        )
+
+        operations = result['operations']
+        assert all('error' in op for op in operations[:6])
+        assert operations[6]['operation_id'] == 'getClaim'
+
+    def test_get_operations_reports_malformed_items(self, operation_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that items of the wrong shape are reported per item without failing the batch."""
+        mcp_server = OpenAPIMCPServer(operation_specs)
+        result = mcp_server.get_operations(
+            [
+                'benefits-claims-v2',
+                {'api_id': ['benefits-claims-v2']},
+                {'api_id': 'benefits-claims-v2', 'operation_id': ['getClaim']},
+                {'api_id': 'benefits-claims-v2', 'path': {'/claims/{id}': None}, 'method': 'get'},
+                {'api_id': 'benefits-claims-v2', 'operation_id': 'getClaim'},
+            ]
+        )
+
+        operations = result['operations']
+        assert operations[0] == {'request': 'benefits-claims-v2', 'error': 'Each operation must be an object'}
+        assert operations[1]['error'] == 'api_id must be a string'
+        assert operations[2]['error'] == 'operation_id must be a string'
+        assert operations[3]['error'] == 'path must be a string'
+        assert operations[4]['operation_id'] == 'getClaim'
+
+    @pytest.mark.asyncio
+    async def test_call_get_operations_tool(self, operation_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that the get_operations tool is listed and returns the batch result as JSON."""
+        mcp_server = OpenAPIMCPServer(operation_specs)
+
+        list_handler = mcp_server.server.request_handlers[types.ListToolsRequest]
+        tools = await list_handler(types.ListToolsRequest(method='tools/list'))
+        assert isinstance(tools.root, types.ListToolsResult)
+        assert [tool.name for tool in tools.root.tools] == ['get_operations']
+
+        call_handler = mcp_server.server.request_handlers[types.CallToolRequest]
+        arguments = {'operations': [{'api_id': 'benefits-claims-v2', 'operation_id': 'getClaim'}]}
+        result = await call_handler(
+            types.CallToolRequest(
+                method='tools/call',
+                params=types.CallToolRequestParams(name='get_operations', arguments=arguments),
+            )
+        )
+
+        assert isinstance(result.root, types.CallToolResult)
+        assert not result.root.isError
+        content = result.root.content[0]
+        assert isinstance(content, types.TextContent)
+        assert json.loads(content.text) == mcp_server.get_operations(arguments['operations'])
+
+    @pytest.mark.asyncio
+    async def test_call_get_operations_tool_malformed_items(self, operation_specs: dict[str, dict[str, Any]]) -> None:
+        """Test that malformed items sent through the tool are reported per item without failing the batch."""
+        mcp_server = OpenAPIMCPServer(operation_specs)
+
+        call_handler = mcp_server.server.request_handlers[types.CallToolRequest]
+        arguments = {
+            'operations': [
+                'x',
+                {'api_id': ['benefits-claims-v2']},
+                {'api_id': 'benefits-claims-v2', 'operation_id': 'getClaim'},
+            ]
+        }
+        result = await call_handler(
+            types.CallToolRequest(
+                method='tools/call',
+                params=types.CallToolRequestParams(name='get_operations', arguments=arguments),
+            )
+        )
+
+        assert isinstance(result.root, types.CallToolResult)
+        assert not result.root.isError
+        content = result.root.content[0]
+        assert isinstance(content, types.TextContent)
+        operations = json.loads(content.text)['operations']
+        assert operations[0] == {'request': 'x', 'error': 'Each operation must be an object'}
+        assert operations[1]['error'] == 'api_id must be a string'
+        assert operations[2]['operation_id'] == 'getClaim'
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('arguments', [{}, {'operations': []}, {'operations': 'getClaim'}])
+    async def test_call_get_operations_tool_invalid_arguments(
+        self, operation_specs: dict[str, dict[str, Any]], arguments: dict[str, Any]
+    ) -> None:
+        """Test that the tool call fails when operations is not a non-empty list."""
+        mcp_server = OpenAPIMCPServer(operation_specs)
+
+        call_handler = mcp_server.server.request_handlers[types.CallToolRequest]
+        result = await call_handler(
+            types.CallToolRequest(
+                method='tools/call',
+                params=types.CallToolRequestParams(name='get_operations', arguments=arguments),
+            )
+        )
+
+        assert isinstance(result.root, types.CallToolResult)
+        assert result.root.isError
@@ -0,0 +1,69 @@
+"""Tests for the operations module."""
+
+from typing import Any
+
+import pytest
+
+from app.operations import build_operation_id_index, collect_local_refs, resolve_local_ref
+
+
+@pytest.fixture
+def sample_spec() -> dict[str, Any]:
+    """Sample OpenAPI specification with nested schema references."""
+    return {
+        'openapi': '3.0.1',
+        'paths': {
+            '/claims': {
+                'get': {
+                    'operationId': 'listClaims',
+                    'responses': {
+                        '200': {'content': {'application/json': {'schema': {'$ref': '#/components/schemas/Claims'}}}},
+                    },
+                },
+                'parameters': [{'$ref': '#/components/parameters/Page'}],
+            },
+            '/claims/{id}': {
+                'get': {'operationId': 'getClaim'},
+            },
+        },
+        'components': {
+            'parameters': {'Page': {'name': 'page', 'in': 'query'}},
+            'schemas': {
+                'Claims': {'type': 'array', 'items': {'$ref': '#/components/schemas/Claim'}},
+                'Claim': {'type': 'object', 'properties': {'parent': {'$ref': '#/components/schemas/Claim'}}},
+                'a/b': {'type': 'string'},
+                'c/d e': {'type': 'integer'},
+            },
+        },
+    }
+
+
+def test_build_operation_id_index(sample_spec: dict[str, Any]) -> None:
+    """Test that operationIds map to their path and method."""
+    assert build_operation_id_index(sample_spec) == {
+        'listClaims': ('/claims', 'get'),
+        'getClaim': ('/claims/{id}', 'get'),
+    }
+
+
+def test_resolve_local_ref(sample_spec: dict[str, Any]) -> None:
+    """Test resolving local, escaped, missing and external references."""
+    assert resolve_local_ref(sample_spec, '#/components/parameters/Page') == {'name': 'page', 'in': 'query'}
+    assert resolve_local_ref(sample_spec, '#/components/schemas/a~1b') == {'type': 'string'}
+    assert resolve_local_ref(sample_spec, '#/components/schemas/a%2Fb') == {'type': 'string'}
+    assert resolve_local_ref(sample_spec, '#/components/schemas/c~1d%20e') == {'type': 'integer'}
+    assert resolve_local_ref(sample_spec, '#/paths/~1claims/parameters/0') == {'$ref': '#/components/parameters/Page'}
+    assert resolve_local_ref(sample_spec, '#/components/schemas/Missing') is None
+    assert resolve_local_ref(sample_spec, 'other.yaml#/components/schemas/Claim') is None
+
+
+def test_collect_local_refs_transitive(sample_spec: dict[str, Any]) -> None:
+    """Test that references are collected transitively, including recursive schemas."""
+    definitions: dict[str, Any] = {}
+    collect_local_refs(sample_spec, sample_spec['paths']['/claims'], definitions)
+
+    assert set(definitions) == {
+        '#/components/schemas/Claims',
+        '#/components/schemas/Claim',
+        '#/components/parameters/Page',
+    }
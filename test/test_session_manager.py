@@ -0,0 +1,132 @@
+"""Tests for the session_manager module."""
+
+from typing import Any
+
+import anyio
+import pytest
+
+from app.session_manager import SseSessionManager
+
+
+class EchoServer:
+    """Minimal stand-in for an MCP server that echoes every inbound message."""
+
+    def create_initialization_options(self) -> None:
+        return None
+
+    async def run(self, read_stream: Any, write_stream: Any, options: Any) -> None:
+        async for message in read_stream:
+            await write_stream.send(message)
+
+
+class IdleServer:
+    """Minimal stand-in for an MCP server that never sends or reads anything."""
+
+    def create_initialization_options(self) -> None:
+        return None
+
+    async def run(self, read_stream: Any, write_stream: Any, options: Any) -> None:
+        await anyio.sleep_forever()
+
+
+class FloodServer:
+    """Minimal stand-in for an MCP server that sends messages as fast as it can."""
+
+    def create_initialization_options(self) -> None:
+        return None
+
+    async def run(self, read_stream: Any, write_stream: Any, options: Any) -> None:
+        for i in range(100):
+            await write_stream.send(i)
+        await anyio.sleep_forever()
+
+
+class TestSseSessionManager:
+    """Tests for the SseSessionManager class."""
+
+    def test_acquire_respects_limit(self) -> None:
+        """Test that sessions are refused once the limit is reached and allowed again after release."""
+        manager = SseSessionManager(max_sessions=2)
+
+        first = manager.acquire()
+        second = manager.acquire()
+        assert first is not None
+        assert second is not None
+        assert manager.acquire() is None
+
+        manager.release(first)
+        assert manager.acquire() is not None
+        assert len(manager.stats()) == 2
+
+    @pytest.mark.asyncio
+    async def test_run_forwards_messages(self) -> None:
+        """Test that messages flow through the session and are counted."""
+        manager = SseSessionManager(max_sessions=1)
+        session = manager.acquire()
+        assert session is not None
+
+        client_send, read_stream = anyio.create_memory_object_stream[Any](1)
+        write_stream, client_recv = anyio.create_memory_object_stream[Any](1)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(session.run, EchoServer(), read_stream, write_stream)
+            await client_send.send('ping')
+            assert await client_recv.receive() == 'ping'
+            await client_send.aclose()
+
+        assert session.messages_received == 1
+        assert session.messages_sent == 1
+        assert session.close_reason is None
+        # The transport's write stream is closed once the session ends
+        with pytest.raises(anyio.EndOfStream):
+            await client_recv.receive()
+
+    @pytest.mark.asyncio
+    async def test_run_client_disconnect_while_replying(self) -> None:
+        """Test that a client disconnecting while a reply is in flight ends the session without an error."""
+        manager = SseSessionManager(max_sessions=1)
+        session = manager.acquire()
+        assert session is not None
+
+        client_send, read_stream = anyio.create_memory_object_stream[Any](1)
+        write_stream, client_recv = anyio.create_memory_object_stream[Any](0)
+        client_recv.close()
+        await client_send.send('ping')
+
+        with anyio.fail_after(5):
+            await session.run(EchoServer(), read_stream, write_stream)
+
+        assert session.close_reason == 'client disconnected'
+        assert session.messages_received == 1
+        assert session.messages_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_run_reaps_idle_session(self) -> None:
+        """Test that a session with no traffic is closed after the idle timeout."""
+        manager = SseSessionManager(idle_timeout=0.05)
+        session = manager.acquire()
+        assert session is not None
+
+        _, read_stream = anyio.create_memory_object_stream[Any](0)
+        write_stream, _ = anyio.create_memory_object_stream[Any](0)
+
+        with anyio.fail_after(5):
+            await session.run(IdleServer(), read_stream, write_stream)
+
+        assert session.close_reason == 'idle'
+
+    @pytest.mark.asyncio
+    async def test_run_drops_slow_consumer(self) -> None:
+        """Test that a client that stops reading is dropped once the outbound queue is full."""
+        manager = SseSessionManager(send_queue_size=2, send_timeout=0.05)
+        session = manager.acquire()
+        assert session is not None
+
+        _, read_stream = anyio.create_memory_object_stream[Any](0)
+        write_stream, _client_recv = anyio.create_memory_object_stream[Any](0)
+
+        with anyio.fail_after(5):
+            await session.run(FloodServer(), read_stream, write_stream)
+
+        assert session.close_reason == 'slow consumer'
+        assert session.messages_sent == 0
@@ -1,13 +1,14 @@
 """Tests for the spec_fetcher module."""
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.spec_fetcher import SpecFetcher
+from app.spec_fetcher import SpecFetcher, detect_spec_format
 
 
 @pytest.fixture
@@ -34,6 +35,23 @@ def sample_spec() -> dict[str, Any]:
     }
 
 
+@pytest.mark.parametrize(
+    ('url', 'content_type', 'expected'),
+    [
+        ('https://example.com/openapi.json', 'application/json', 'json'),
+        ('https://example.com/openapi', 'application/yaml; charset=utf-8', 'yaml'),
+        ('https://example.com/openapi', 'text/x-yaml', 'yaml'),
+        ('https://example.com/openapi.yaml', 'text/plain', 'yaml'),
+        ('https://example.com/openapi.YML?ref=main', '', 'yaml'),
+        ('https://example.com/openapi.yaml', 'application/vnd.oai.openapi+json', 'json'),
+        ('https://example.com/apidocs', '', 'json'),
+    ],
+)
+def test_detect_spec_format(url: str, content_type: str, expected: str) -> None:
+    """Test that the spec format is detected from the content type and URL extension."""
+    assert detect_spec_format(url, content_type) == expected
+
+
 class TestSpecFetcher:
     """Tests for the SpecFetcher class."""
 
@@ -52,6 +70,7 @@ class TestSpecFetcher:
     async def test_fetch_spec_success(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
         """Test successfully fetching an OpenAPI specification."""
         mock_response = MagicMock()
+        mock_response.headers = {'content-type': 'application/json'}
         mock_response.json.return_value = sample_spec
         mock_response.raise_for_status = MagicMock()
 
@@ -67,6 +86,77 @@ class TestSpecFetcher:
             with open(cache_path) as f:
                 cached_data = json.load(f)
             assert cached_data == sample_spec
+            assert spec_fetcher.load_cached_metadata('test-api') == {
+                'url': 'https://example.com/openapi.json',
+                'source_format': 'json',
+            }
+
+    @pytest.mark.asyncio
+    async def test_fetch_spec_yaml(self, spec_fetcher: SpecFetcher) -> None:
+        """Test that YAML specs are parsed once and cached as normalized JSON."""
+        mock_response = MagicMock()
+        mock_response.headers = {'content-type': 'application/yaml'}
+        mock_response.text = (
+            'openapi: 3.0.1\n'
+            'info: {title: Test API, version: v1}\n'
+            'paths:\n'
+            '  /claims:\n'
+            '    get:\n'
+            '      responses:\n'
+            '        200: {description: OK}\n'
+        )
+        mock_response.raise_for_status = MagicMock()
+
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+
+            result = await spec_fetcher.fetch_spec('test-api', 'https://example.com/openapi')
+
+        assert result['paths']['/claims']['get']['responses'] == {'200': {'description': 'OK'}}
+        mock_response.json.assert_not_called()
+        assert spec_fetcher.load_cached_spec('test-api') == result
+        assert spec_fetcher.load_cached_metadata('test-api') == {
+            'url': 'https://example.com/openapi',
+            'source_format': 'yaml',
+        }
+
+    def test_parse_yaml_spec_keeps_yaml_1_1_booleans_as_strings(self, spec_fetcher: SpecFetcher) -> None:
+        """Test that unquoted yes/no/on/off stay strings while true/false are still booleans."""
+        result = spec_fetcher._parse_yaml_spec(
+            'components:\n'
+            '  schemas:\n'
+            '    Answer:\n'
+            '      type: string\n'
+            '      enum: [YES, NO, on, off]\n'
+            '      nullable: true\n'
+            '      properties:\n'
+            '        on: {type: boolean, default: false}\n'
+        )
+
+        answer = result['components']['schemas']['Answer']
+        assert answer['enum'] == ['YES', 'NO', 'on', 'off']
+        assert answer['nullable'] is True
+        assert answer['properties'] == {'on': {'type': 'boolean', 'default': False}}
+
+    @pytest.mark.asyncio
+    async def test_fetch_spec_yaml_not_mapping(self, spec_fetcher: SpecFetcher) -> None:
+        """Test that a YAML document that is not a mapping is rejected."""
+        mock_response = MagicMock()
+        mock_response.headers = {}
+        mock_response.text = '- not\n- a spec\n'
+        mock_response.raise_for_status = MagicMock()
+
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+
+            with pytest.raises(ValueError):
+                await spec_fetcher.fetch_spec('test-api', 'https://example.com/openapi.yaml')
+
+        assert not spec_fetcher._get_cache_path('test-api').exists()
+
+    def test_load_cached_metadata_not_exists(self, spec_fetcher: SpecFetcher) -> None:
+        """Test loading metadata for a spec that was never cached."""
+        assert spec_fetcher.load_cached_metadata('nonexistent-api') is None
 
     def test_load_cached_spec_exists(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
         """Test loading a cached specification that exists."""
@@ -77,6 +167,106 @@ class TestSpecFetcher:
         result = spec_fetcher.load_cached_spec('test-api')
         assert result == sample_spec
 
+    @pytest.mark.asyncio
+    async def test_fetch_spec_writes_index(self, spec_fetcher: SpecFetcher) -> None:
+        """Test that fetching a spec writes a sidecar index usable for fragment reads."""
+        spec = {
+            'openapi': '3.0.1',
+            'paths': {'/claims': {'get': {'operationId': 'listClaims'}}},
+            'components': {'schemas': {'Claim': {'type': 'object'}}},
+        }
+        mock_response = MagicMock()
+        mock_response.headers = {'content-type': 'application/json'}
+        mock_response.json.return_value = spec
+        mock_response.raise_for_status = MagicMock()
+
+        with patch('httpx.AsyncClient') as mock_client:
+            mock_client.return_value.__aenter__.return_value.get = AsyncMock(return_value=mock_response)
+
+            await spec_fetcher.fetch_spec('test-api', 'https://example.com/openapi.json')
+
+        assert spec_fetcher._get_index_path('test-api').exists()
+        fragment = spec_fetcher.read_cached_fragment('test-api', '/paths/~1claims/get')
+        assert fragment is not None
+        assert json.loads(fragment) == {'operationId': 'listClaims'}
+        fragment = spec_fetcher.read_cached_fragment('test-api', '/components/schemas/Claim')
+        assert fragment is not None
+        assert json.loads(fragment) == {'type': 'object'}
+        assert spec_fetcher.read_cached_fragment('test-api', '/paths/~1missing') is None
+
+    def test_read_cached_fragment_without_index(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
+        """Test that fragment reads return None when no index has been written."""
+        cache_path = spec_fetcher._get_cache_path('test-api')
+        with open(cache_path, 'w') as f:
+            json.dump(sample_spec, f)
+
+        assert spec_fetcher.read_cached_fragment('test-api', '/paths') is None
+
+    def test_read_cached_fragment_stale_index(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
+        """Test that fragment reads return None when the cache was rewritten without its index."""
+        spec_fetcher._write_cache('test-api', {'paths': {'/claims': {}}})
+        with open(spec_fetcher._get_cache_path('test-api'), 'w') as f:
+            json.dump(sample_spec, f, indent=2)
+
+        assert spec_fetcher.read_cached_fragment('test-api', '/paths/~1claims') is None
+
+    def test_read_cached_fragment_same_size_rewrite(self, spec_fetcher: SpecFetcher) -> None:
+        """Test that fragment reads return None when the cache was rewritten with the same size."""
+        cache_path = spec_fetcher._write_cache('test-api', {'paths': {'/a': {'get': {}}, '/b': {}}})
+        text = cache_path.read_text()
+        cache_path.write_text(text.replace('/a', '/c'))
+        stat = cache_path.stat()
+        # Make sure the rewrite is visible even on filesystems with coarse timestamps
+        os.utime(cache_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache_path.stat().st_size == len(text)
+        assert spec_fetcher.read_cached_fragment('test-api', '/paths/~1a') is None
+
+    @pytest.mark.asyncio
+    async def test_get_spec_rebuilds_missing_index(self, spec_fetcher: SpecFetcher) -> None:
+        """Test that a cache hit without an index gets one, so fragment reads work."""
+        spec = {'openapi': '3.0.1', 'paths': {'/claims': {'get': {'operationId': 'listClaims'}}}}
+        cache_path = spec_fetcher._get_cache_path('test-api')
+        with open(cache_path, 'w') as f:
+            json.dump(spec, f, indent=2)
+
+        result = await spec_fetcher.get_spec('test-api', 'https://example.com/openapi.json', use_cache=True)
+
+        assert result == spec
+        assert spec_fetcher._get_index_path('test-api').exists()
+        fragment = spec_fetcher.read_cached_fragment('test-api', '/paths/~1claims/get')
+        assert fragment is not None
+        assert json.loads(fragment) == {'operationId': 'listClaims'}
+        assert spec_fetcher.load_cached_metadata('test-api') == {
+            'url': 'https://example.com/openapi.json',
+            'source_format': 'json',
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_spec_keeps_existing_metadata(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
+        """Test that a cache hit does not overwrite metadata recorded when the spec was fetched."""
+        spec_fetcher._write_cache('test-api', sample_spec)
+        spec_fetcher._write_metadata('test-api', 'https://example.com/openapi.yaml', 'yaml')
+
+        await spec_fetcher.get_spec('test-api', 'https://example.com/openapi.yaml', use_cache=True)
+
+        assert spec_fetcher.load_cached_metadata('test-api') == {
+            'url': 'https://example.com/openapi.yaml',
+            'source_format': 'yaml',
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_spec_keeps_valid_index(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
+        """Test that a cache hit with a valid index does not rewrite the cache."""
+        cache_path = spec_fetcher._write_cache('test-api', sample_spec)
+        mtime = cache_path.stat().st_mtime_ns
+
+        with patch.object(spec_fetcher, '_write_cache') as write_cache:
+            await spec_fetcher.get_spec('test-api', 'https://example.com/openapi.json', use_cache=True)
+
+        write_cache.assert_not_called()
+        assert cache_path.stat().st_mtime_ns == mtime
+
     def test_load_cached_spec_not_exists(self, spec_fetcher: SpecFetcher) -> None:
         """Test loading a cached specification that doesn't exist."""
         result = spec_fetcher.load_cached_spec('nonexistent-api')
@@ -106,6 +296,7 @@ class TestSpecFetcher:
     async def test_get_spec_without_cache(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
         """Test getting a spec when cache should not be used."""
         mock_response = MagicMock()
+        mock_response.headers = {'content-type': 'application/json'}
         mock_response.json.return_value = sample_spec
         mock_response.raise_for_status = MagicMock()
 
@@ -119,6 +310,7 @@ class TestSpecFetcher:
     async def test_fetch_all_specs_success(self, spec_fetcher: SpecFetcher, sample_spec: dict[str, Any]) -> None:
         """Test fetching all configured API specifications."""
         mock_response = MagicMock()
+        mock_response.headers = {'content-type': 'application/json'}
         mock_response.json.return_value = sample_spec
         mock_response.raise_for_status = MagicMock()
 
@@ -145,6 +337,7 @@ class TestSpecFetcher:
             if 'benefits-claims' in url:
                 raise Exception('Network error')
             mock_response = MagicMock()
+            mock_response.headers = {'content-type': 'application/json'}
             mock_response.json.return_value = sample_spec
             mock_response.raise_for_status = MagicMock()
             return mock_response
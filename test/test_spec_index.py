@@ -0,0 +1,75 @@
+"""Tests for the spec_index module."""
+
+import json
+from typing import Any
+
+import pytest
+
+from app.spec_index import INDEX_VERSION, build_json_pointer, build_spec_index, escape_pointer_token
+
+
+@pytest.fixture
+def sample_spec() -> dict[str, Any]:
+    """Sample OpenAPI specification with paths and components for testing."""
+    return {
+        'openapi': '3.0.1',
+        'info': {'title': 'Test API – Ünïcode', 'version': 'v1'},
+        'paths': {
+            '/claims/{id}': {
+                'parameters': [{'name': 'id', 'in': 'path'}],
+                'get': {'operationId': 'getClaim', 'responses': {'200': {'description': 'OK'}}},
+                'delete': {'operationId': 'deleteClaim'},
+            },
+        },
+        'components': {
+            'schemas': {'Claim': {'type': 'object', 'properties': {'id': {'type': 'string'}}}},
+        },
+    }
+
+
+def test_escape_pointer_token() -> None:
+    """Test that '~' and '/' are escaped per RFC 6901."""
+    assert escape_pointer_token('/claims/{id}') == '~1claims~1{id}'
+    assert escape_pointer_token('a~b') == 'a~0b'
+
+
+def test_build_json_pointer() -> None:
+    """Test that pointers are built from unescaped tokens."""
+    assert build_json_pointer('paths', '/claims', 'get') == '/paths/~1claims/get'
+    assert build_json_pointer() == ''
+
+
+def test_build_spec_index_round_trip(sample_spec: dict[str, Any]) -> None:
+    """Test that the compact text parses back to the original specification."""
+    text, index = build_spec_index(sample_spec)
+
+    assert json.loads(text) == sample_spec
+    assert text.isascii()
+    assert index['size'] == len(text)
+    assert index['version'] == INDEX_VERSION
+
+
+def test_build_spec_index_pointers(sample_spec: dict[str, Any]) -> None:
+    """Test that path items, operations and components map to their exact slices."""
+    text, index = build_spec_index(sample_spec)
+    pointers = index['pointers']
+
+    expected = {
+        '/paths/~1claims~1{id}': sample_spec['paths']['/claims/{id}'],
+        '/paths/~1claims~1{id}/get': sample_spec['paths']['/claims/{id}']['get'],
+        '/paths/~1claims~1{id}/delete': sample_spec['paths']['/claims/{id}']['delete'],
+        '/components/schemas/Claim': sample_spec['components']['schemas']['Claim'],
+    }
+    assert set(pointers) == set(expected)
+    for pointer, value in expected.items():
+        start, end = pointers[pointer]
+        assert json.loads(text[start:end]) == value
+
+
+def test_build_spec_index_swagger_definitions() -> None:
+    """Test that Swagger 2 definitions are indexed."""
+    spec = {'swagger': '2.0', 'paths': {}, 'definitions': {'Claim': {'type': 'object'}}}
+    text, index = build_spec_index(spec)
+
+    start, end = index['pointers']['/definitions/Claim']
+    assert json.loads(text[start:end]) == {'type': 'object'}